@@ -9,10 +9,15 @@ Endpoints:
 """
 
 import asyncio
+from functools import lru_cache, partial
+
+import msgspec
 
 from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
 from typing import Optional, List
 
 from pipecat.transports.smallwebrtc.request_handler import (
@@ -23,6 +28,7 @@ from pipecat.transports.smallwebrtc.request_handler import (
 )
 from pipecat.transports.smallwebrtc.connection import SmallWebRTCConnection
 
+from core.config import settings
 from core.pipeline import create_pipeline
 from commons.logger import logger
 
@@ -35,27 +41,31 @@ app = FastAPI(
     version="1.0.0",
 )
 
+# Only the signaling verbs and JSON bodies are needed; max_age lets the browser
+# cache the preflight for the whole session instead of re-sending OPTIONS.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=[settings.FRONTEND_ORIGIN],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH"],
+    allow_headers=["content-type"],
+    max_age=86400,
 )
 
 
-@app.middleware("http")
-async def log_request_headers(request, call_next):
-    log.debug(f"Request Headers for {request.url.path}: {dict(request.headers)}")
-    response = await call_next(request)
-    return response
+# Header logging is debug-only. Module loggers are always set to DEBUG (see
+# commons.logger), so the gate is the configured LOG_LEVEL rather than
+# log.isEnabledFor — otherwise every request would still build the dict.
+if settings.LOG_LEVEL.lower() == "debug":
 
-
-# ── Exception Handlers ────────────────────────────────────────────────────────
-from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+    @app.middleware("http")
+    async def log_request_headers(request, call_next):
+        log.debug(f"Request Headers for {request.url.path}: {dict(request.headers)}")
+        response = await call_next(request)
+        return response
 
 
+# ── Exception Handlers ────────────────────────────────────────────────────────
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request, exc):
     log.error(f"Validation Error {request.method} {request.url}: {exc}")
@@ -79,10 +89,49 @@ async def validation_exception_handler(request, exc):
 
 
 # ── Official Pipecat WebRTC request handler ───────────────────────────────────
-_handler = SmallWebRTCRequestHandler()
+@lru_cache(maxsize=1)
+def _get_handler() -> SmallWebRTCRequestHandler:
+    """Lazily create the process-wide request handler (one per worker)."""
+    return SmallWebRTCRequestHandler()
+
 
+# Strong refs to running pipelines; the event loop only keeps weak ones.
+_pipeline_tasks: set[asyncio.Task] = set()
 
-# ── Pydantic schemas ──────────────────────────────────────────────────────────
+
+def _log_pipeline_done(pc_id: str, pipeline_task: asyncio.Task):
+    """Done-callback for a pipeline runner task: log how it finished."""
+    _pipeline_tasks.discard(pipeline_task)
+    exc = None if pipeline_task.cancelled() else pipeline_task.exception()
+    if exc is not None:
+        log.error(f"Pipeline error [{pc_id}]: {exc}", exc_info=exc)
+    log.info(f"Pipeline ended for {pc_id}")
+
+
+async def _on_connection(connection: SmallWebRTCConnection):
+    """
+    Called by SmallWebRTCRequestHandler after the connection is initialized.
+    Starts the Pipecat pipeline as a background task.
+    """
+    log.info(f"Callback on_connection triggered for {connection.pc_id}")
+    log.info(f"Calling create_pipeline for {connection.pc_id}")
+    try:
+        runner, task = await create_pipeline(connection)
+        log.info(f"create_pipeline returned successfully for {connection.pc_id}")
+
+        log.info(f"Starting pipeline runner for {connection.pc_id}")
+        pipeline_task = asyncio.create_task(
+            runner.run(task), name=f"pipeline-{connection.pc_id}"
+        )
+        _pipeline_tasks.add(pipeline_task)
+        pipeline_task.add_done_callback(partial(_log_pipeline_done, connection.pc_id))
+        log.info(f"Background task created for {connection.pc_id}")
+    except Exception as e:
+        log.error(f"Error in on_connection logic: {e}", exc_info=True)
+        raise e
+
+
+# ── Request schemas ───────────────────────────────────────────────────────────
 class OfferRequest(BaseModel):
     sdp: str
     type: str
@@ -90,20 +139,20 @@ class OfferRequest(BaseModel):
     restart_pc: Optional[bool] = None
 
     model_config = {
+        "frozen": True,
         "populate_by_name": True,
         "extra": "ignore",
     }
 
 
-class IceCandidateSchema(BaseModel):
-    candidate: str
-    sdp_mid: str
-    sdp_mline_index: int
-
-
-class PatchRequest(BaseModel):
+# PATCH is the highest-frequency signaling call and needs no custom
+# validators, so it is decoded with msgspec instead of Pydantic. IceCandidate
+# is pipecat's stdlib dataclass; msgspec decodes straight into it, so the
+# candidates can be handed to the handler without a rebuild. Unknown keys are
+# ignored, matching OfferRequest's extra="ignore".
+class PatchRequest(msgspec.Struct, frozen=True, kw_only=True):
     pc_id: Optional[str] = None
-    candidates: List[IceCandidateSchema]
+    candidates: List[IceCandidate]
 
 
 class AnswerResponse(BaseModel):
@@ -115,6 +164,36 @@ class AnswerResponse(BaseModel):
     sessionId: str  # Potential alias
 
 
+# ── Helpers ───────────────────────────────────────────────────────────────────
+async def _parse_body(request: Request, model: type[BaseModel | msgspec.Struct]):
+    """
+    Parse and validate the raw request body in a single pass.
+
+    Both model_validate_json and msgspec work on bytes directly, so the
+    Content-Type header does not matter. Validation errors are re-raised as
+    RequestValidationError so the 422 handler above still formats the response.
+    """
+    raw = await request.body()
+    if issubclass(model, msgspec.Struct):
+        try:
+            # strict=False keeps Pydantic's lax coercion, e.g. "0" -> 0.
+            return msgspec.json.decode(raw, type=model, strict=False)
+        except msgspec.DecodeError as exc:
+            # ValidationError subclasses DecodeError; a bare DecodeError is
+            # malformed JSON. msgspec's message already names the failing path.
+            error_type = (
+                "value_error"
+                if isinstance(exc, msgspec.ValidationError)
+                else "json_invalid"
+            )
+            errors = [{"type": error_type, "loc": (), "msg": str(exc)}]
+            raise RequestValidationError(errors, body=raw)
+    try:
+        return model.model_validate_json(raw)
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors(), body=raw)
+
+
 # ── Routes ────────────────────────────────────────────────────────────────────
 @app.get("/", tags=["Health"])
 async def health_check():
@@ -130,16 +209,7 @@ async def webrtc_offer(request: Request):
     This means the connection is fully wired before we return the SDP answer,
     which prevents race conditions during ICE negotiation.
     """
-    try:
-        data = await request.json()
-    except Exception:
-        # Fallback if content-type is missing/wrong
-        body_bytes = await request.body()
-        import json
-
-        data = json.loads(body_bytes)
-
-    body = OfferRequest(**data)
+    body = await _parse_body(request, OfferRequest)
 
     log.info(f"SDP offer received (pc_id={body.pc_id}, type={body.type})")
 
@@ -150,47 +220,14 @@ async def webrtc_offer(request: Request):
         restart_pc=body.restart_pc,
     )
 
-    async def on_connection(connection: SmallWebRTCConnection):
-        """
-        Called by SmallWebRTCRequestHandler after the connection is initialized.
-        Starts the Pipecat pipeline as a background task.
-        """
-        log.info(f"Callback on_connection triggered for {connection.pc_id}")
-        log.info(f"Calling create_pipeline for {connection.pc_id}")
-        try:
-            runner, task = await create_pipeline(connection)
-            log.info(f"create_pipeline returned successfully for {connection.pc_id}")
-
-            async def _run():
-                try:
-                    log.info(f"Starting pipeline runner for {connection.pc_id}")
-                    await runner.run(task)
-                except Exception as exc:
-                    log.error(
-                        f"Pipeline error [{connection.pc_id}]: {exc}", exc_info=True
-                    )
-                finally:
-                    log.info(f"Pipeline ended for {connection.pc_id}")
-
-            asyncio.create_task(_run())
-            log.info(f"Background task created for {connection.pc_id}")
-        except Exception as e:
-            log.error(f"Error in on_connection logic: {e}", exc_info=True)
-            raise e
-
     log.info("Calling handle_web_request...")
-    answer = await _handler.handle_web_request(req, on_connection)
+    answer = await _get_handler().handle_web_request(req, _on_connection)
     log.info("handle_web_request returned.")
 
     log.info(f"Returning SDP answer for pc_id={answer['pc_id']}")
-    return AnswerResponse(
-        sdp=answer["sdp"],
-        type=answer["type"],
-        pc_id=answer["pc_id"],
-        pcId=answer["pc_id"],
-        id=answer["pc_id"],
-        sessionId=answer["pc_id"],
-    )
+    # handle_web_request builds a fresh dict per call, so alias pc_id in place.
+    answer["pcId"] = answer["id"] = answer["sessionId"] = answer["pc_id"]
+    return answer
 
 
 @app.patch("/api/offer", tags=["WebRTC"])
@@ -199,15 +236,7 @@ async def webrtc_ice_candidates(request: Request):
     Trickle ICE: browser sends individual ICE candidates after the offer.
     This is required for proper ICE connectivity even on the same machine.
     """
-    try:
-        data = await request.json()
-    except Exception:
-        body_bytes = await request.body()
-        import json
-
-        data = json.loads(body_bytes)
-
-    body = PatchRequest(**data)
+    body = await _parse_body(request, PatchRequest)
 
     if not body.pc_id:
         log.warning("ICE candidates received without pc_id, skipping.")
@@ -219,17 +248,10 @@ async def webrtc_ice_candidates(request: Request):
 
     patch_request = SmallWebRTCPatchRequest(
         pc_id=body.pc_id,
-        candidates=[
-            IceCandidate(
-                candidate=c.candidate,
-                sdp_mid=c.sdp_mid,
-                sdp_mline_index=c.sdp_mline_index,
-            )
-            for c in body.candidates
-        ],
+        candidates=body.candidates,
     )
 
-    await _handler.handle_patch_request(patch_request)
+    await _get_handler().handle_patch_request(patch_request)
     return {"status": "ok"}
 
 
@@ -237,4 +259,4 @@ async def webrtc_ice_candidates(request: Request):
 async def shutdown():
     """Clean up all active WebRTC connections on server shutdown."""
     log.info("Server shutting down — closing all WebRTC connections")
-    await _handler.close()
+    await _get_handler().close()
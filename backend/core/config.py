@@ -22,6 +22,7 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     LOG_LEVEL: str = "info"
+    FRONTEND_ORIGIN: str = "*"  # Set to the deployed frontend URL in production
 
     class Config:
         env_file = ".env"
@@ -15,25 +15,17 @@ VAD note: Silero is broken on Windows (DLL issue). We use the built-in
           requires no external native libs.
 """
 
-from pipecat.frames.frames import TTSSpeakFrame
-from pipecat.pipeline.pipeline import Pipeline
-from pipecat.pipeline.runner import PipelineRunner
-from pipecat.pipeline.task import PipelineTask, PipelineParams
-from pipecat.processors.aggregators.llm_context import LLMContext
-from pipecat.processors.aggregators.llm_response_universal import (
-    LLMContextAggregatorPair,
-)
-from pipecat.services.deepgram.stt import DeepgramSTTService
-from pipecat.services.deepgram.tts import DeepgramTTSService
-from pipecat.services.groq.llm import GroqLLMService
-from pipecat.transports.smallwebrtc.transport import SmallWebRTCTransport
-from pipecat.transports.smallwebrtc.connection import SmallWebRTCConnection
-from pipecat.transports.base_transport import TransportParams
+from typing import TYPE_CHECKING
 
 from core.config import settings
-from core.prompt import SYSTEM_PROMPT
+from core.prompt import SYSTEM_PROMPT_VOICE
 from commons.logger import logger
 
+if TYPE_CHECKING:
+    from pipecat.pipeline.runner import PipelineRunner
+    from pipecat.pipeline.task import PipelineTask
+    from pipecat.transports.smallwebrtc.connection import SmallWebRTCConnection
+
 log = logger(__name__)
 
 # Greeting the bot speaks the moment the call connects
@@ -41,14 +33,30 @@ GREETING = "Hi there! I'm Aria, your AI assistant. How can I help you today?"
 
 
 async def create_pipeline(
-    webrtc_connection: SmallWebRTCConnection,
-) -> tuple[PipelineRunner, PipelineTask]:
+    webrtc_connection: "SmallWebRTCConnection",
+) -> tuple["PipelineRunner", "PipelineTask"]:
     """
     Instantiate all AI services and wire the Pipecat pipeline for one call session.
 
     Returns:
         (PipelineRunner, PipelineTask) — caller must call runner.run(task).
     """
+    # Services are imported on first use so app startup doesn't pay for the
+    # whole pipecat service tree; later calls hit the sys.modules cache.
+    from pipecat.frames.frames import TTSSpeakFrame
+    from pipecat.pipeline.pipeline import Pipeline
+    from pipecat.pipeline.runner import PipelineRunner
+    from pipecat.pipeline.task import PipelineTask, PipelineParams
+    from pipecat.processors.aggregators.llm_context import LLMContext
+    from pipecat.processors.aggregators.llm_response_universal import (
+        LLMContextAggregatorPair,
+    )
+    from pipecat.services.deepgram.stt import DeepgramSTTService
+    from pipecat.services.deepgram.tts import DeepgramTTSService
+    from pipecat.services.groq.llm import GroqLLMService
+    from pipecat.transports.smallwebrtc.transport import SmallWebRTCTransport
+    from pipecat.transports.base_transport import TransportParams
+
     log.info(f"Building pipeline for connection {webrtc_connection.pc_id}")
 
     # ── Transport ─────────────────────────────────────────────────────────────
@@ -84,7 +92,7 @@ async def create_pipeline(
     )
 
     # ── LLM Context ───────────────────────────────────────────────────────────
-    context = LLMContext(messages=[{"role": "system", "content": SYSTEM_PROMPT}])
+    context = LLMContext(messages=[{"role": "system", "content": SYSTEM_PROMPT_VOICE}])
     context_aggregator = LLMContextAggregatorPair(context)
 
     # ── Pipeline ──────────────────────────────────────────────────────────────
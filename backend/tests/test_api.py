@@ -0,0 +1,167 @@
+"""
+Signaling endpoint tests. The pipecat request handler is stubbed out, so no
+peer connections or pipelines are created.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from core.apis import api
+
+CANDIDATE = {
+    "candidate": "candidate:1 1 udp 1 0.0.0.0 9 typ host",
+    "sdp_mid": "0",
+    "sdp_mline_index": 0,
+}
+BAD_CANDIDATE = "not-a-candidate"
+
+
+class FakeHandler:
+    """Stands in for SmallWebRTCRequestHandler and records what it was given."""
+
+    def __init__(self):
+        self.patches = []
+        self.last_patch = None
+        self.gate = None  # set to an asyncio.Event to hold deliveries open
+
+    async def handle_web_request(self, request, callback):
+        return {"sdp": "answer-sdp", "type": "answer", "pc_id": "pc-1"}
+
+    async def handle_patch_request(self, request):
+        # Mirrors pipecat: unknown pc_id is a 404, and a malformed candidate
+        # makes aiortc's candidate_from_sdp raise AssertionError.
+        if request.pc_id != "pc-1":
+            raise HTTPException(status_code=404, detail="Peer connection not found")
+        self.last_patch = request
+        candidates = [c.candidate for c in request.candidates]
+        assert BAD_CANDIDATE not in candidates
+        self.patches.append(candidates)
+        if self.gate is not None:
+            await self.gate.wait()
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    fake = FakeHandler()
+    monkeypatch.setattr(api, "_get_handler", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def client(handler):
+    return TestClient(api.app)
+
+
+def test_offer_ignores_content_type(client):
+    body = json.dumps({"sdp": "offer-sdp", "type": "offer"})
+    resp = client.post(
+        "/api/offer", content=body, headers={"content-type": "text/plain"}
+    )
+
+    assert resp.status_code == 200
+    assert resp.json()["pc_id"] == "pc-1"
+
+
+def test_offer_malformed_json_is_422(client):
+    resp = client.post("/api/offer", content=b"{not json")
+
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["type"] == "json_invalid"
+
+
+def test_offer_missing_field_is_422(client):
+    resp = client.post("/api/offer", json={"type": "offer"})
+
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["loc"] == ["sdp"]
+
+
+def test_offer_returns_answer_with_pc_id_aliases(client):
+    resp = client.post("/api/offer", json={"sdp": "offer-sdp", "type": "offer"})
+
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "sdp": "answer-sdp",
+        "type": "answer",
+        "pc_id": "pc-1",
+        "pcId": "pc-1",
+        "id": "pc-1",
+        "sessionId": "pc-1",
+    }
+
+
+def test_patch_delivers_candidates(client, handler):
+    resp = client.patch("/api/offer", json={"pc_id": "pc-1", "candidates": [CANDIDATE]})
+
+    assert resp.status_code == 200
+    assert resp.json() == {"status": "ok"}
+    assert handler.patches == [[CANDIDATE["candidate"]]]
+
+
+def test_patch_unknown_pc_id_is_404(client):
+    resp = client.patch("/api/offer", json={"pc_id": "gone", "candidates": [CANDIDATE]})
+
+    assert resp.status_code == 404
+
+
+def test_patch_without_pc_id_is_ignored(client, handler):
+    resp = client.patch("/api/offer", json={"candidates": [CANDIDATE]})
+
+    assert resp.json() == {"status": "ignored"}
+    assert handler.patches == []
+
+
+def test_patch_coerces_numeric_strings(client, handler):
+    candidate = dict(CANDIDATE, sdp_mline_index="0")
+    resp = client.patch("/api/offer", json={"pc_id": "pc-1", "candidates": [candidate]})
+
+    assert resp.status_code == 200
+    assert handler.last_patch.candidates[0].sdp_mline_index == 0
+
+
+def test_patch_malformed_json_is_422(client):
+    resp = client.patch("/api/offer", content=b"{not json")
+
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["type"] == "json_invalid"
+
+
+def test_patch_invalid_field_is_422(client):
+    candidate = dict(CANDIDATE, sdp_mid=1)
+    resp = client.patch("/api/offer", json={"pc_id": "pc-1", "candidates": [candidate]})
+
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["type"] == "value_error"
+
+
+def test_overlapping_patches_fail_independently(handler):
+    """A bad candidate sent while another PATCH is in flight only fails itself."""
+
+    async def scenario():
+        handler.gate = asyncio.Event()
+        transport = httpx.ASGITransport(app=api.app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+
+            def patch(candidate):
+                body = {
+                    "pc_id": "pc-1",
+                    "candidates": [dict(CANDIDATE, candidate=candidate)],
+                }
+                return c.patch("/api/offer", json=body)
+
+            good = asyncio.create_task(patch("good"))
+            await asyncio.sleep(0.01)  # "good" is now in flight
+            bad = await patch(BAD_CANDIDATE)
+            handler.gate.set()
+            return (await good), bad
+
+    good, bad = asyncio.run(scenario())
+
+    assert good.status_code == 200
+    assert bad.status_code == 500
+    assert handler.patches == [["good"]]